@@ -1,7 +1,9 @@
 from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi.responses import StreamingResponse
 from typing import List, Dict, Optional
 from pydantic import BaseModel
 import logging
+import orjson
 
 from ..services.google_ads_service import GoogleAdsService
 
@@ -36,11 +38,34 @@ class CampaignPerformance(BaseModel):
     conversions: float
     averageCpc: float
 
+class CampaignPerformanceColumns(BaseModel):
+    campaignId: List[str]
+    campaignName: List[str]
+    status: List[str]
+    impressions: List[int]
+    clicks: List[int]
+    cost: List[float]
+    conversions: List[float]
+    averageCpc: List[float]
+
 class BidBudgetUpdate(BaseModel):
     customerId: str
     campaignId: str
     newBudget: Optional[float] = None
     newBid: Optional[float] = None
+    budgetResource: Optional[str] = None
+
+class CampaignUpdate(BaseModel):
+    campaignId: str
+    newBudget: Optional[float] = None
+    newBid: Optional[float] = None
+    biddingStrategy: Optional[str] = None
+    budgetResource: Optional[str] = None
+
+class BulkUpdate(BaseModel):
+    customerId: str
+    updates: List[CampaignUpdate]
+    atomic: bool = True  # False: update campaigns independently, reporting partial failures
 
 class UpdateResponse(BaseModel):
     success: bool
@@ -52,15 +77,33 @@ class BiddingStrategyUpdate(BaseModel):
     campaignId: str
     biddingStrategy: str
 
+# Shared GoogleAdsService instance (keeps one HTTP session for all requests)
+_ads_service: Optional[GoogleAdsService] = None
+
 # Dependency to get GoogleAdsService instance
 async def get_ads_service():
+    global _ads_service
     try:
-        service = GoogleAdsService()
-        return service
+        if _ads_service is None:
+            _ads_service = GoogleAdsService()
+        return _ads_service
     except Exception as e:
         logger.error(f"Failed to initialize Google Ads service: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to initialize Google Ads service")
 
+async def close_ads_service():
+    """Close the shared GoogleAdsService instance, if it was created"""
+    global _ads_service
+    if _ads_service is not None:
+        await _ads_service.close()
+        _ads_service = None
+
+def _parse_campaign_ids(campaign_ids: Optional[str]) -> Optional[List[str]]:
+    """Parse a comma-separated campaign_ids query parameter, if provided"""
+    if not campaign_ids:
+        return None
+    return [cid.strip() for cid in campaign_ids.split(",")]
+
 @router.get("/accounts", response_model=List[ClientAccount])
 async def list_accounts(service: GoogleAdsService = Depends(get_ads_service)):
     """
@@ -107,7 +150,8 @@ async def update_bid_budget(
             update_data.customerId,
             update_data.campaignId,
             update_data.newBudget,
-            update_data.newBid
+            update_data.newBid,
+            update_data.budgetResource
         )
         return result
     except HTTPException:
@@ -127,11 +171,7 @@ async def get_campaign_performance(
     Get performance metrics for campaigns
     """
     try:
-        # Parse campaign IDs if provided
-        campaign_id_list = None
-        if campaign_ids:
-            campaign_id_list = [cid.strip() for cid in campaign_ids.split(",")]
-            
+        campaign_id_list = _parse_campaign_ids(campaign_ids)
         return await service.get_campaign_performance(customer_id, campaign_id_list, date_range)
     except HTTPException:
         raise
@@ -139,6 +179,59 @@ async def get_campaign_performance(
         logger.error(f"Error getting campaign performance: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error getting campaign performance: {str(e)}")
 
+@router.get("/performance/{customer_id}/columns", response_model=CampaignPerformanceColumns)
+async def get_campaign_performance_columns(
+    customer_id: str,
+    campaign_ids: Optional[str] = Query(None, description="Comma-separated list of campaign IDs"),
+    date_range: str = Query("LAST_30_DAYS", description="Time period for the report (e.g., LAST_7_DAYS, LAST_30_DAYS)"),
+    service: GoogleAdsService = Depends(get_ads_service)
+):
+    """
+    Get performance metrics for campaigns as columns (one list per metric)
+    """
+    try:
+        campaign_id_list = _parse_campaign_ids(campaign_ids)
+        return await service.get_campaign_performance_columns(customer_id, campaign_id_list, date_range)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting campaign performance: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error getting campaign performance: {str(e)}")
+
+@router.get("/performance/{customer_id}/stream")
+async def stream_campaign_performance(
+    customer_id: str,
+    campaign_ids: Optional[str] = Query(None, description="Comma-separated list of campaign IDs"),
+    date_range: str = Query("LAST_30_DAYS", description="Time period for the report (e.g., LAST_7_DAYS, LAST_30_DAYS)"),
+    service: GoogleAdsService = Depends(get_ads_service)
+):
+    """
+    Stream performance metrics for campaigns as newline-delimited JSON
+    """
+    campaign_id_list = _parse_campaign_ids(campaign_ids)
+    
+    rows = service.get_campaign_performance_stream(customer_id, campaign_id_list, date_range)
+    
+    # Read the first row before responding so upstream errors keep their status code
+    try:
+        first_row = await rows.__anext__()
+    except StopAsyncIteration:
+        first_row = None
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting campaign performance: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error getting campaign performance: {str(e)}")
+    
+    async def ndjson():
+        if first_row is None:
+            return
+        yield orjson.dumps(first_row) + b"\n"
+        async for row in rows:
+            yield orjson.dumps(row) + b"\n"
+    
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
 @router.post("/update-bidding-strategy", response_model=UpdateResponse)
 async def update_bidding_strategy(
     update_data: BiddingStrategyUpdate,
@@ -158,4 +251,28 @@ async def update_bidding_strategy(
         raise
     except Exception as e:
         logger.error(f"Error updating bidding strategy: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Error updating bidding strategy: {str(e)}") 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Error updating bidding strategy: {str(e)}") 
+
+@router.post("/bulk-update", response_model=UpdateResponse)
+async def bulk_update(
+    update_data: BulkUpdate,
+    service: GoogleAdsService = Depends(get_ads_service)
+):
+    """
+    Update budgets and/or bidding strategies of several campaigns in a single request
+    """
+    try:
+        if not update_data.updates:
+            raise HTTPException(status_code=400, detail="At least one update must be provided")
+            
+        updates = [update.model_dump() for update in update_data.updates]
+        if update_data.atomic:
+            result = await service.bulk_update(update_data.customerId, updates)
+        else:
+            result = await service.update_campaigns_bulk(update_data.customerId, updates)
+        return result
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error in bulk update: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error in bulk update: {str(e)}")
\ No newline at end of file
@@ -1,13 +1,248 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, AsyncIterator, Awaitable, Callable, Optional, Tuple
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, fields
+from functools import lru_cache
+import asyncio
 import logging
 import os
+import random
 import ssl
+import time
+from urllib.parse import urlencode
 import aiohttp
+import httpx
+from aiolimiter import AsyncLimiter
+import ijson
+import orjson
 from fastapi import HTTPException
 
 # Setup logger
 logger = logging.getLogger(__name__)
 
+# Google Ads API endpoints
+API_VERSION = "v17"
+BASE_URL = f"https://googleads.googleapis.com/{API_VERSION}"
+TOKEN_URL = "https://oauth2.googleapis.com/token"
+TOKEN_REQUEST_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+# Google Ads reports money amounts in micros (1/1,000,000 of the currency unit)
+MICROS_PER_UNIT = 1_000_000
+
+# Refresh access tokens this many seconds before Google says they expire
+TOKEN_EXPIRY_MARGIN = 60
+
+# Retry policy for rate-limited (429) and server error (5xx) responses
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 0.5  # seconds
+RETRY_MAX_DELAY = 8.0  # seconds
+
+# Circuit breaker: stop calling the API for a while after repeated failures
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_TIMEOUT = 30  # seconds
+
+# Upper bound on cached campaign info entries; the least recently used are evicted first
+CAMPAIGN_INFO_CACHE_MAX_SIZE = 10_000
+
+# Maximum number of concurrent Google Ads calls issued by one bulk operation
+BULK_CONCURRENCY = 20
+
+# Map API bidding strategy names to the required format for the API
+BIDDING_STRATEGIES = {
+    "MAXIMIZE_CONVERSIONS": {"maximizeConversions": {}},
+    "MAXIMIZE_CONVERSION_VALUE": {"maximizeConversionValue": {}},
+    "TARGET_CPA": {"targetCpa": {"targetCpaMicros": "1000000"}},  # Default $1 CPA
+    "TARGET_ROAS": {"targetRoas": {"targetRoas": 1.0}},  # Default 100% ROAS
+    "MANUAL_CPC": {"manualCpc": {"enhancedCpcEnabled": True}},
+    "TARGET_SPEND": {"targetSpend": {}}
+}
+
+# Simulated client accounts returned when GOOGLE_ADS_FAKE=1 (local development only)
+FAKE_CLIENT_ACCOUNTS = [
+    {"accountId": "1234567890", "accountName": "Client Account 1", "currencyCode": "USD", "status": "ENABLED"},
+    {"accountId": "0987654321", "accountName": "Client Account 2", "currencyCode": "EUR", "status": "ENABLED"},
+    {"accountId": "2345678901", "accountName": "Client Account 3", "currencyCode": "USD", "status": "PAUSED"}
+]
+
+# GAQL queries, built once at import time
+CLIENT_ACCOUNTS_QUERY = """
+    SELECT
+        customer_client.client_customer,
+        customer_client.level,
+        customer_client.currency_code,
+        customer_client.descriptive_name,
+        customer_client.status
+    FROM customer_client
+    WHERE customer_client.manager = FALSE
+"""
+
+LIST_CAMPAIGNS_QUERY = """
+    SELECT
+        campaign.id,
+        campaign.name,
+        campaign.status,
+        campaign.advertising_channel_type,
+        campaign.bidding_strategy_type,
+        campaign_budget.amount_micros,
+        campaign.campaign_budget
+    FROM campaign
+"""
+
+CAMPAIGN_INFO_QUERY = """
+    SELECT
+        campaign.id,
+        campaign.name,
+        campaign.status,
+        campaign.bidding_strategy_type,
+        campaign.campaign_budget
+    FROM campaign
+    WHERE campaign.id = {campaign_id}
+"""
+
+CAMPAIGN_PERFORMANCE_QUERY = """
+    SELECT
+        campaign.id,
+        campaign.name,
+        campaign.status,
+        metrics.impressions,
+        metrics.clicks,
+        metrics.cost_micros,
+        metrics.conversions,
+        metrics.average_cpc
+    FROM campaign
+    WHERE segments.date DURING {date_range}
+"""
+
+# Allowed campaign status filters and the WHERE clause each one adds
+CAMPAIGN_STATUS_FILTERS = {
+    status: f" WHERE campaign.status = '{status}'"
+    for status in ("ENABLED", "PAUSED", "REMOVED")
+}
+
+# Predefined GAQL date ranges accepted by DURING
+DATE_RANGES = frozenset([
+    "TODAY", "YESTERDAY", "LAST_7_DAYS", "LAST_14_DAYS", "LAST_30_DAYS",
+    "LAST_BUSINESS_WEEK", "THIS_MONTH", "LAST_MONTH", "THIS_WEEK_SUN_TODAY",
+    "THIS_WEEK_MON_TODAY", "LAST_WEEK_SUN_SAT", "LAST_WEEK_MON_SUN"
+])
+
+@dataclass(slots=True)
+class CampaignPerformanceRow:
+    """Performance metrics of one campaign, as streamed by get_campaign_performance_stream"""
+    campaignId: str
+    campaignName: str
+    status: str
+    impressions: int
+    clicks: int
+    cost: float
+    conversions: float
+    averageCpc: float
+
+CAMPAIGN_PERFORMANCE_FIELDS = tuple(field.name for field in fields(CampaignPerformanceRow))
+
+def _performance_values(item: Dict) -> Tuple:
+    """Extract one searchStream result as values in CAMPAIGN_PERFORMANCE_FIELDS order"""
+    campaign = item.get("campaign", {})
+    metrics = item.get("metrics", {})
+    
+    # Convert micros to regular currency units
+    return (
+        campaign.get("id", ""),
+        campaign.get("name", ""),
+        campaign.get("status", ""),
+        int(metrics.get("impressions", 0)),
+        int(metrics.get("clicks", 0)),
+        float(metrics.get("costMicros", 0)) / MICROS_PER_UNIT,
+        float(metrics.get("conversions", 0)),
+        float(metrics.get("averageCpc", 0)) / MICROS_PER_UNIT
+    )
+
+def _validate_campaign_id(campaign_id: str):
+    """Reject campaign IDs that are not plain numbers before they reach a GAQL query"""
+    if not (isinstance(campaign_id, str) and campaign_id.isascii() and campaign_id.isdigit()):
+        raise HTTPException(status_code=400, detail=f"Invalid campaign ID: {campaign_id}")
+
+@lru_cache(maxsize=256)
+def _campaign_performance_query(campaign_ids: Tuple[str, ...], date_range: str) -> str:
+    """Build the campaign performance query for already validated arguments"""
+    query = CAMPAIGN_PERFORMANCE_QUERY.format(date_range=date_range)
+    if campaign_ids:
+        query += f" AND campaign.id IN ({', '.join(campaign_ids)})"
+    return query
+
+def _validate_campaign_update(update: Dict):
+    """Validate a single entry of a bulk campaign update"""
+    _validate_campaign_id(update.get("campaignId"))
+    if not update.get("newBudget") and not update.get("newBid") and not update.get("biddingStrategy"):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Campaign {update.get('campaignId')}: either newBudget, newBid or biddingStrategy must be provided"
+        )
+    bidding_strategy = update.get("biddingStrategy")
+    if bidding_strategy and bidding_strategy not in BIDDING_STRATEGIES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid bidding strategy: {bidding_strategy}. Valid strategies are: {', '.join(BIDDING_STRATEGIES)}"
+        )
+
+def _budget_operation(budget_resource: str, budget_micros: int) -> Dict:
+    """Build a googleAds:mutate operation that updates a campaign budget amount"""
+    return {
+        "campaignBudgetOperation": {
+            "updateMask": "amountMicros",
+            "update": {
+                "resourceName": budget_resource,
+                "amountMicros": str(budget_micros)
+            }
+        }
+    }
+
+def _bidding_strategy_operation(customer_id: str, campaign_id: str, bidding_strategy: str) -> Dict:
+    """Build a googleAds:mutate operation that updates a campaign bidding strategy"""
+    return {
+        "campaignOperation": {
+            "updateMask": "biddingStrategy",
+            "update": {
+                "resourceName": f"customers/{customer_id}/campaigns/{campaign_id}",
+                "biddingStrategy": BIDDING_STRATEGIES[bidding_strategy]
+            }
+        }
+    }
+
+async def _gather_bounded(coros, limit: int = BULK_CONCURRENCY, return_exceptions: bool = False) -> List:
+    """Run coroutines concurrently, with at most `limit` of them in flight at once"""
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def run(coro):
+        async with semaphore:
+            return await coro
+    
+    return await asyncio.gather(*(run(coro) for coro in coros), return_exceptions=return_exceptions)
+
+class _HttpxBodyReader:
+    """Expose a streaming httpx response through the read(n) interface of aiohttp.StreamReader"""
+    
+    def __init__(self, response: httpx.Response):
+        self._chunks = response.aiter_bytes()
+        self._buffer = b""
+    
+    async def read(self, n: int = -1) -> bytes:
+        if n < 0:
+            chunks = [self._buffer]
+            self._buffer = b""
+            async for chunk in self._chunks:
+                chunks.append(chunk)
+            return b"".join(chunks)
+        
+        while not self._buffer:
+            try:
+                self._buffer = await self._chunks.__anext__()
+            except StopAsyncIteration:
+                return b""
+        data, self._buffer = self._buffer[:n], self._buffer[n:]
+        return data
+
 class GoogleAdsService:
     def __init__(self):
         """Initialize the Google Ads service with credentials from environment variables"""
@@ -16,9 +251,43 @@ class GoogleAdsService:
         self.client_secret = os.getenv("GOOGLE_ADS_CLIENT_SECRET")
         self.refresh_token = os.getenv("GOOGLE_ADS_REFRESH_TOKEN")
         self.login_customer_id = os.getenv("GOOGLE_ADS_LOGIN_CUSTOMER_ID")
-        self.api_version = "v17"
-        self.base_url = f"https://googleads.googleapis.com/{self.api_version}"
+        self.api_version = API_VERSION
+        self.base_url = BASE_URL
         self.access_token = None
+        self._auth_header = ""  # "Bearer <access_token>", replaced on every refresh
+        self._token_expiry = 0.0  # time.monotonic() deadline for access_token
+        self._token_lock = asyncio.Lock()
+        
+        # Client-side rate limiting: cap in-flight calls and, optionally, calls per second
+        self._req_sem = asyncio.Semaphore(int(os.getenv("GOOGLE_ADS_MAX_CONCURRENCY", "10")))
+        max_qps = float(os.getenv("GOOGLE_ADS_MAX_QPS", "0"))
+        # One token per 1/max_qps seconds also supports rates below one call per second
+        self._rate_limiter = AsyncLimiter(1, 1 / max_qps) if max_qps > 0 else None
+        
+        # Circuit breaker state
+        self._circuit_failures = 0
+        self._circuit_open_until = 0.0
+        
+        # Short-lived cache of campaign info, keyed by (customer_id, campaign_id)
+        self._campaign_info_ttl = float(os.getenv("GOOGLE_ADS_CAMPAIGN_CACHE_TTL", "60"))
+        self._campaign_info_cache: "OrderedDict[Tuple[str, str], Tuple[float, Dict]]" = OrderedDict()
+        
+        # In-flight read requests, so concurrent identical calls share one upstream request
+        self._inflight: Dict[str, asyncio.Future] = {}
+        
+        # Shared HTTP clients (created lazily, reused across requests). HTTP/2 via
+        # httpx is the default; GOOGLE_ADS_HTTP_CLIENT=aiohttp uses HTTP/1.1 instead.
+        self._use_http2 = os.getenv("GOOGLE_ADS_HTTP_CLIENT", "httpx") != "aiohttp"
+        self._client: Optional[httpx.AsyncClient] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # SSL context shared by all connections; verification can only be
+        # disabled explicitly for local development
+        self._ssl_ctx = ssl.create_default_context()
+        if os.getenv("GOOGLE_ADS_INSECURE_SSL") == "1":
+            logger.warning("SSL certificate verification disabled (GOOGLE_ADS_INSECURE_SSL=1)")
+            self._ssl_ctx.check_hostname = False
+            self._ssl_ctx.verify_mode = ssl.CERT_NONE
         
         # Validate required credentials
         if not all([
@@ -30,104 +299,288 @@ class GoogleAdsService:
         ]):
             logger.error("Missing Google Ads API credentials")
             raise ValueError("Missing Google Ads API credentials")
+        
+        # Headers that never change for this service; Authorization is added per request
+        self._base_headers = {
+            "developer-token": self.developer_token,
+            "login-customer-id": self.login_customer_id
+        }
+        self._json_headers = {**self._base_headers, "Content-Type": "application/json"}
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared client session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                ssl=self._ssl_ctx,
+                limit=100,
+                limit_per_host=20,
+                keepalive_timeout=75,
+                ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+    
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP/2 client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                verify=self._ssl_ctx,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                timeout=httpx.Timeout(30.0, connect=5.0)
+            )
+        return self._client
+    
+    async def close(self):
+        """Close the shared HTTP clients"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    @asynccontextmanager
+    async def _send(self, method: str, url: str, headers: Dict, body: Optional[bytes]) -> AsyncIterator[Tuple[int, Any]]:
+        """
+        Send a single HTTP request with the configured client
+        
+        Yields:
+            Tuple[int, Any]: Response status and a body reader with an async read(n) method
+        """
+        if self._use_http2:
+            client = await self._get_client()
+            async with client.stream(method, url, headers=headers, content=body) as response:
+                yield response.status_code, _HttpxBodyReader(response)
+        else:
+            session = await self._get_session()
+            async with session.request(method, url, headers=headers, data=body) as response:
+                yield response.status, response.content
             
     async def _get_access_token(self) -> str:
         """Get access token using refresh token"""
         logger.info("Getting access token")
         
-        token_url = "https://oauth2.googleapis.com/token"
+        payload = {
+            "client_id": self.client_id,
+            "client_secret": self.client_secret,
+            "refresh_token": self.refresh_token,
+            "grant_type": "refresh_token"
+        }
+        try:
+            async with self._send("POST", TOKEN_URL, TOKEN_REQUEST_HEADERS, urlencode(payload).encode()) as (status, response_body):
+                response_json = orjson.loads(await response_body.read())
+                if "access_token" not in response_json:
+                    logger.error(f"Failed to get access token: {response_json}")
+                    raise HTTPException(status_code=500, detail="Failed to authenticate with Google Ads API")
+                
+                expires_in = int(response_json.get("expires_in", 3600))
+                self._token_expiry = time.monotonic() + expires_in - TOKEN_EXPIRY_MARGIN
+                return response_json["access_token"]
+        except Exception as e:
+            logger.error(f"Error getting access token: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Error authenticating: {str(e)}")
+    
+    async def _single_flight(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fetch() once for all concurrent callers using the same key
         
-        # Create SSL context that doesn't verify certificates for development
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
+        The shared call runs in its own task, so a cancelled caller does not
+        cancel it for the others.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+    
+    def _get_cached_campaign_info(self, customer_id: str, campaign_id: str) -> Optional[Dict]:
+        """Return fresh cached campaign info, dropping the entry if it has expired"""
+        key = (str(customer_id), str(campaign_id))
+        cached = self._campaign_info_cache.get(key)
+        if cached is None:
+            return None
+        if time.monotonic() - cached[0] >= self._campaign_info_ttl:
+            del self._campaign_info_cache[key]
+            return None
+        self._campaign_info_cache.move_to_end(key)
+        return cached[1]
+    
+    def _cache_campaign_info(self, customer_id: str, campaign_id: str, campaign_info: Dict):
+        """Store campaign info, keeping a fresh cached entry that has more fields"""
+        cached = self._get_cached_campaign_info(customer_id, campaign_id)
+        if cached is not None and len(cached) > len(campaign_info):
+            return
+        key = (str(customer_id), str(campaign_id))
+        self._campaign_info_cache[key] = (time.monotonic(), campaign_info)
+        self._campaign_info_cache.move_to_end(key)
+        while len(self._campaign_info_cache) > CAMPAIGN_INFO_CACHE_MAX_SIZE:
+            self._campaign_info_cache.popitem(last=False)
+    
+    def _invalidate_campaign_info(self, customer_id: str, campaign_id: str):
+        """Drop cached campaign info after the campaign was modified"""
+        self._campaign_info_cache.pop((str(customer_id), str(campaign_id)), None)
+    
+    async def _ensure_access_token(self, stale_token: Optional[str] = None) -> str:
+        """
+        Return a valid access token, refreshing it only when needed
         
-        # Create a client session with the SSL context
-        async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=ssl_context)) as session:
-            payload = {
-                "client_id": self.client_id,
-                "client_secret": self.client_secret,
-                "refresh_token": self.refresh_token,
-                "grant_type": "refresh_token"
-            }
+        Args:
+            stale_token: Token rejected by the API (e.g. on 401); forces a refresh
+                         unless another request already replaced it
             
-            try:
-                async with session.post(token_url, data=payload) as response:
-                    response_json = await response.json()
-                    if "access_token" not in response_json:
-                        logger.error(f"Failed to get access token: {response_json}")
-                        raise HTTPException(status_code=500, detail="Failed to authenticate with Google Ads API")
-                        
-                    return response_json["access_token"]
-            except Exception as e:
-                logger.error(f"Error getting access token: {str(e)}")
-                raise HTTPException(status_code=500, detail=f"Error authenticating: {str(e)}")
+        Returns:
+            str: Access token
+        """
+        async with self._token_lock:
+            if (
+                self.access_token
+                and self.access_token != stale_token
+                and time.monotonic() < self._token_expiry
+            ):
+                return self.access_token
+            
+            self.access_token = await self._get_access_token()
+            self._auth_header = f"Bearer {self.access_token}"
+            return self.access_token
     
-    async def _make_request(self, endpoint: str, method: str = "GET", data: Dict = None) -> Dict:
-        """Make request to Google Ads API"""
+    def _check_circuit(self):
+        """Fail fast while the circuit breaker is open"""
+        if time.monotonic() < self._circuit_open_until:
+            raise HTTPException(status_code=503, detail="Google Ads API temporarily unavailable, try again later")
+    
+    def _record_failure(self):
+        """Count an upstream failure, opening the circuit after too many in a row"""
+        self._circuit_failures += 1
+        if self._circuit_failures >= CIRCUIT_FAILURE_THRESHOLD:
+            logger.warning(f"Google Ads API failed {self._circuit_failures} times in a row, pausing requests for {CIRCUIT_RESET_TIMEOUT}s")
+            self._circuit_open_until = time.monotonic() + CIRCUIT_RESET_TIMEOUT
+    
+    def _record_success(self):
+        """Reset the circuit breaker after a successful call"""
+        self._circuit_failures = 0
+        self._circuit_open_until = 0.0
+    
+    @asynccontextmanager
+    async def _request(self, endpoint: str, method: str = "GET", data: Dict = None) -> AsyncIterator[Any]:
+        """
+        Send a request to Google Ads API and yield the successful response
+        
+        Refreshes the access token once on 401 and retries 429/5xx responses with
+        exponential backoff and jitter. Each attempt waits for a concurrency slot
+        (and a rate limiter token, if configured) until the response status is
+        known; backoff sleeps and body reads do not hold one.
+        
+        Args:
+            endpoint: API endpoint, relative to the versioned base URL
+            method: HTTP method (GET or POST)
+            data: Request body for POST requests
+            
+        Yields:
+            Body reader of the response with status 200 (async read(n) method)
+        """
+        if method not in ("GET", "POST"):
+            raise ValueError(f"Unsupported method: {method}")
+        
+        self._check_circuit()
+        
         full_url = f"{self.base_url}/{endpoint}"
         
         # Ensure we have a valid access token
-        if not self.access_token:
-            self.access_token = await self._get_access_token()
-        
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "developer-token": self.developer_token,
-            "login-customer-id": self.login_customer_id
-        }
+        access_token = await self._ensure_access_token()
         
-        logger.info(f"Making {method} request to {endpoint}")
+        # Serialize the body once; it is reused if the request has to be retried
+        body = None
+        if method == "POST":
+            headers = {**self._json_headers, "Authorization": self._auth_header}
+            body = orjson.dumps(data)
+        else:
+            headers = {**self._base_headers, "Authorization": self._auth_header}
         
-        # Create SSL context that doesn't verify certificates for development
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
+        token_refreshed = False
+        retries = 0
         
-        # Create a client session with the SSL context
-        async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=ssl_context)) as session:
+        while True:
+            # The concurrency slot covers sending the request and reading the status;
+            # it is released before the body is handed to the caller, so slow stream
+            # consumers cannot starve other calls
+            await self._req_sem.acquire()
+            slot_held = True
             try:
-                if method == "GET":
-                    async with session.get(full_url, headers=headers) as response:
-                        if response.status == 401:  # Token expired
-                            logger.info("Access token expired, refreshing...")
-                            self.access_token = await self._get_access_token()
-                            headers["Authorization"] = f"Bearer {self.access_token}"
-                            async with session.get(full_url, headers=headers) as new_response:
-                                if new_response.status != 200:
-                                    error_text = await new_response.text()
-                                    logger.error(f"Error {new_response.status}: {error_text}")
-                                    raise HTTPException(status_code=new_response.status, detail=f"Google Ads API error: {error_text}")
-                                return await new_response.json()
-                        elif response.status != 200:
-                            error_text = await response.text()
-                            logger.error(f"Error {response.status}: {error_text}")
-                            raise HTTPException(status_code=response.status, detail=f"Google Ads API error: {error_text}")
-                        return await response.json()
-                elif method == "POST":
-                    async with session.post(full_url, headers=headers, json=data) as response:
-                        if response.status == 401:  # Token expired
-                            logger.info("Access token expired, refreshing...")
-                            self.access_token = await self._get_access_token()
-                            headers["Authorization"] = f"Bearer {self.access_token}"
-                            async with session.post(full_url, headers=headers, json=data) as new_response:
-                                if new_response.status != 200:
-                                    error_text = await new_response.text()
-                                    logger.error(f"Error {new_response.status}: {error_text}")
-                                    raise HTTPException(status_code=new_response.status, detail=f"Google Ads API error: {error_text}")
-                                return await new_response.json()
-                        elif response.status != 200:
-                            error_text = await response.text()
-                            logger.error(f"Error {response.status}: {error_text}")
-                            raise HTTPException(status_code=response.status, detail=f"Google Ads API error: {error_text}")
-                        return await response.json()
-                else:
-                    raise ValueError(f"Unsupported method: {method}")
-            except HTTPException:
+                if self._rate_limiter is not None:
+                    await self._rate_limiter.acquire()
+                
+                async with self._send(method, full_url, headers, body) as (status, response_body):
+                    if status == 200:
+                        self._req_sem.release()
+                        slot_held = False
+                        self._record_success()
+                        yield response_body
+                        return
+                    
+                    can_refresh = status == 401 and not token_refreshed
+                    can_retry = status in RETRY_STATUSES and retries < MAX_RETRIES
+                    if not (can_refresh or can_retry):
+                        error_text = (await response_body.read()).decode("utf-8", errors="replace")
+                        logger.error(f"Error {status}: {error_text}")
+                        if status >= 500:
+                            self._record_failure()
+                        raise HTTPException(status_code=status, detail=f"Google Ads API error: {error_text}")
+            except (aiohttp.ClientError, httpx.TransportError, asyncio.TimeoutError):
+                self._record_failure()
                 raise
-            except Exception as e:
-                logger.error(f"Error making request: {str(e)}")
-                raise HTTPException(status_code=500, detail=f"Error communicating with Google Ads API: {str(e)}")
+            finally:
+                if slot_held:
+                    self._req_sem.release()
+            
+            if can_refresh:
+                logger.info("Access token expired, refreshing...")
+                token_refreshed = True
+                access_token = await self._ensure_access_token(stale_token=access_token)
+                headers["Authorization"] = self._auth_header
+            else:
+                delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** retries) + random.uniform(0, 0.1)
+                retries += 1
+                logger.warning(f"Google Ads API returned {status}, retrying in {delay:.2f}s ({retries}/{MAX_RETRIES})")
+                await asyncio.sleep(delay)
+    
+    async def _make_request(self, endpoint: str, method: str = "GET", data: Dict = None) -> Dict:
+        """Make request to Google Ads API"""
+        logger.info(f"Making {method} request to {endpoint}")
+        
+        try:
+            async with self._request(endpoint, method, data) as response_body:
+                return orjson.loads(await response_body.read())
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Error making request: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Error communicating with Google Ads API: {str(e)}")
+    
+    async def _stream_request(self, endpoint: str, data: Dict, prefix: str) -> AsyncIterator[Dict]:
+        """
+        Make a POST request to Google Ads API and yield JSON items as they arrive
+        
+        Args:
+            endpoint: API endpoint, relative to the versioned base URL
+            data: Request body
+            prefix: ijson prefix of the items to yield (e.g. "item.results.item" for searchStream)
+            
+        Yields:
+            Dict: Items of the response body matching prefix
+        """
+        logger.info(f"Making streaming POST request to {endpoint}")
+        
+        try:
+            async with self._request(endpoint, "POST", data) as response_body:
+                async for item in ijson.items(response_body, prefix, use_float=True):
+                    yield item
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Error making request: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Error communicating with Google Ads API: {str(e)}")
     
     async def list_client_accounts(self) -> List[Dict]:
         """
@@ -138,38 +591,34 @@ class GoogleAdsService:
         """
         logger.info("Listing client accounts")
         
+        if os.getenv("GOOGLE_ADS_FAKE") == "1":
+            logger.warning("Returning simulated client accounts (GOOGLE_ADS_FAKE=1)")
+            return [dict(account) for account in FAKE_CLIENT_ACCOUNTS]
+        
         try:
             # Endpoint para listar contas de gerenciamento
             endpoint = f"customers/{self.login_customer_id}/googleAds:search"
             
             # Query GAQL para obter contas de clientes
-            data = {
-                "query": """
-                    SELECT
-                        customer_client.client_customer,
-                        customer_client.level,
-                        customer_client.currency_code,
-                        customer_client.descriptive_name,
-                        customer_client.status
-                    FROM customer_client
-                    WHERE customer_client.manager = FALSE
-                """
-            }
+            data = {"query": CLIENT_ACCOUNTS_QUERY}
             
-            # Fazer a requisição real
-            result = await self._make_request(endpoint, method="POST", data=data)
+            # Fazer a requisição real (compartilhada entre chamadas simultâneas)
+            result = await self._single_flight(
+                "accounts",
+                lambda: self._make_request(endpoint, method="POST", data=data)
+            )
             
             # Processar o resultado
-            accounts = []
-            if "results" in result:
-                for item in result["results"]:
-                    client_data = item.get("customerClient", {})
-                    accounts.append({
-                        "accountId": client_data.get("clientCustomer", "").split('/')[-1],
-                        "accountName": client_data.get("descriptiveName", ""),
-                        "currencyCode": client_data.get("currencyCode", ""),
-                        "status": client_data.get("status", "")
-                    })
+            accounts = [
+                {
+                    "accountId": client_data.get("clientCustomer", "").rpartition('/')[2],
+                    "accountName": client_data.get("descriptiveName", ""),
+                    "currencyCode": client_data.get("currencyCode", ""),
+                    "status": client_data.get("status", "")
+                }
+                for item in result.get("results", ())
+                for client_data in (item.get("customerClient", {}),)
+            ]
             
             logger.info(f"Successfully listed {len(accounts)} client accounts")
             return accounts
@@ -193,54 +642,52 @@ class GoogleAdsService:
         logger.info(f"Listing campaigns for customer ID: {customer_id}")
         
         try:
-            # Endpoint para listar campanhas
-            endpoint = f"customers/{customer_id}/googleAds:search"
-            
-            # Query GAQL base - Modificada para incluir budget.amount_micros
-            query = """
-                SELECT
-                    campaign.id,
-                    campaign.name,
-                    campaign.status,
-                    campaign.advertising_channel_type,
-                    campaign.bidding_strategy_type,
-                    campaign_budget.amount_micros,
-                    campaign.campaign_budget
-                FROM campaign
-            """
+            # Endpoint para listar campanhas (resultados enviados em lotes pelo searchStream)
+            endpoint = f"customers/{customer_id}/googleAds:searchStream"
             
             # Adicionar filtro por status, se fornecido
+            query = LIST_CAMPAIGNS_QUERY
             if status_filter:
-                query += f" WHERE campaign.status = '{status_filter}'"
+                if status_filter not in CAMPAIGN_STATUS_FILTERS:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Invalid status filter: {status_filter}. Valid statuses are: {', '.join(CAMPAIGN_STATUS_FILTERS)}"
+                    )
+                query += CAMPAIGN_STATUS_FILTERS[status_filter]
             
             data = {"query": query}
             
-            # Fazer a requisição
-            result = await self._make_request(endpoint, method="POST", data=data)
+            # Fazer a requisição (compartilhada entre chamadas simultâneas)
+            async def fetch() -> List[Dict]:
+                return [item async for item in self._stream_request(endpoint, data, "item.results.item")]
+            
+            results = await self._single_flight(f"campaigns:{customer_id}:{status_filter}", fetch)
             
             # Processar o resultado
             campaigns = []
-            if "results" in result:
-                for item in result["results"]:
-                    campaign_data = item.get("campaign", {})
-                    campaign_budget = item.get("campaignBudget", {})
-                    
-                    # Extrair o valor do orçamento em micros e converter para a unidade monetária normal
-                    budget_micros = campaign_budget.get("amountMicros", 0)
-                    budget = float(budget_micros) / 1_000_000 if budget_micros else 0.0
-                    
-                    # Log para depuração
-                    logger.debug(f"Campaign ID: {campaign_data.get('id', '')}, Budget Micros: {budget_micros}, Budget: {budget}")
-                    
-                    campaigns.append({
-                        "campaignId": campaign_data.get("id", ""),
-                        "campaignName": campaign_data.get("name", ""),
-                        "status": campaign_data.get("status", ""),
-                        "type": campaign_data.get("advertisingChannelType", ""),
-                        "biddingStrategy": campaign_data.get("biddingStrategyType", ""),
-                        "budget": budget  # Valor convertido de micros
-                    })
+            for item in results:
+                campaign_data = item.get("campaign", {})
+                campaign_budget = item.get("campaignBudget", {})
+                
+                # Extrair o valor do orçamento em micros e converter para a unidade monetária normal
+                budget_micros = campaign_budget.get("amountMicros", 0)
+                budget = float(budget_micros) / MICROS_PER_UNIT
+                
+                if campaign_data.get("id"):
+                    self._cache_campaign_info(customer_id, campaign_data["id"], campaign_data)
+                
+                campaigns.append({
+                    "campaignId": campaign_data.get("id", ""),
+                    "campaignName": campaign_data.get("name", ""),
+                    "status": campaign_data.get("status", ""),
+                    "type": campaign_data.get("advertisingChannelType", ""),
+                    "biddingStrategy": campaign_data.get("biddingStrategyType", ""),
+                    "budget": budget  # Valor convertido de micros
+                })
             
+            # Log para depuração (uma linha por listagem, não por campanha)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Campaign budgets: %s", {c["campaignId"]: c["budget"] for c in campaigns})
             logger.info(f"Successfully listed {len(campaigns)} campaigns for customer ID: {customer_id}")
             return campaigns
         except HTTPException:
@@ -249,7 +696,29 @@ class GoogleAdsService:
             logger.error(f"Error listing campaigns: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Error listing campaigns: {str(e)}")
     
-    async def update_bid_and_budget(self, customer_id: str, campaign_id: str, new_budget: float = None, new_bid: float = None) -> Dict:
+    async def mutate_campaigns(self, customer_id: str, ops: List[Dict]) -> Dict:
+        """
+        Apply campaign and budget operations in a single googleAds:mutate call
+        
+        Args:
+            customer_id: The customer ID that owns the campaigns
+            ops: Mutate operations (campaignOperation, campaignBudgetOperation, ...)
+            
+        Returns:
+            Dict: Mutate result
+        """
+        endpoint = f"customers/{customer_id}/googleAds:mutate"
+        result = await self._make_request(endpoint, method="POST", data={"mutateOperations": ops})
+        
+        # Modified campaigns must be re-read on the next lookup
+        for op in ops:
+            resource_name = op.get("campaignOperation", {}).get("update", {}).get("resourceName", "")
+            if resource_name:
+                self._invalidate_campaign_info(customer_id, resource_name.rpartition('/')[2])
+        
+        return result
+    
+    async def update_bid_and_budget(self, customer_id: str, campaign_id: str, new_budget: float = None, new_bid: float = None, budget_resource: Optional[str] = None) -> Dict:
         """
         Update campaign budget and/or bid modifier
         
@@ -258,6 +727,7 @@ class GoogleAdsService:
             campaign_id: The campaign ID to update
             new_budget: New budget amount (in the account's currency)
             new_bid: New bid modifier (as a multiplier, e.g., 1.1 for +10%)
+            budget_resource: Optional campaign budget resource name; skips the campaign lookup when provided
             
         Returns:
             Dict: Update status
@@ -269,8 +739,11 @@ class GoogleAdsService:
                 raise HTTPException(status_code=400, detail="Either new budget or new bid must be provided")
                 
             # Get campaign info to check current values and get resource names
-            campaign_info = await self._get_campaign_info(customer_id, campaign_id)
-            logger.info(f"Campaign info: {campaign_info}")
+            if budget_resource:
+                campaign_info = {"campaignBudget": budget_resource}
+            else:
+                campaign_info = await self._get_campaign_info(customer_id, campaign_id)
+            logger.debug("Campaign info: %s", campaign_info)
             
             response = {
                 "success": True,
@@ -291,29 +764,15 @@ class GoogleAdsService:
                     raise HTTPException(status_code=400, detail="Campaign budget resource not found")
                 
                 # Convert currency to micros (Google Ads API uses micros)
-                budget_micros = int(new_budget * 1_000_000)
-                
-                # Create mutation for updating budget
-                endpoint = f"customers/{customer_id}/campaignBudgets:mutate"
+                budget_micros = int(new_budget * MICROS_PER_UNIT)
                 
                 # Build the mutation data
-                budget_id = budget_resource.split('/')[-1]  # Extract ID from resource name
-                data = {
-                    "operations": [
-                        {
-                            "updateMask": "amountMicros",
-                            "update": {
-                                "resourceName": budget_resource,
-                                "amountMicros": str(budget_micros)
-                            }
-                        }
-                    ]
-                }
+                ops = [_budget_operation(budget_resource, budget_micros)]
                 
                 # Make the API call to update the budget
                 try:
-                    update_result = await self._make_request(endpoint, method="POST", data=data)
-                    logger.info(f"Budget update result: {update_result}")
+                    update_result = await self.mutate_campaigns(customer_id, ops)
+                    logger.info("Budget update result: %s", update_result)
                     
                     response["update_details"]["updates"].append({
                         "type": "budget",
@@ -366,25 +825,65 @@ class GoogleAdsService:
         Returns:
             Dict: Campaign information
         """
-        endpoint = f"customers/{customer_id}/googleAds:search"
+        cached = self._get_cached_campaign_info(customer_id, campaign_id)
+        if cached is not None:
+            return cached
+        
+        _validate_campaign_id(campaign_id)
         
-        query = f"""
-            SELECT
-                campaign.id,
-                campaign.name,
-                campaign.status,
-                campaign.bidding_strategy_type,
-                campaign.campaign_budget
-            FROM campaign
-            WHERE campaign.id = {campaign_id}
+        async def fetch() -> Dict:
+            endpoint = f"customers/{customer_id}/googleAds:search"
+            query = CAMPAIGN_INFO_QUERY.format(campaign_id=campaign_id)
+            
+            result = await self._make_request(endpoint, method="POST", data={"query": query})
+            
+            if "results" in result and len(result["results"]) > 0:
+                campaign_info = result["results"][0].get("campaign", {})
+                self._cache_campaign_info(customer_id, campaign_id, campaign_info)
+                return campaign_info
+            else:
+                raise HTTPException(status_code=404, detail=f"Campaign {campaign_id} not found")
+        
+        return await self._single_flight(f"campaign:{customer_id}:{campaign_id}", fetch)
+    
+    def _search_campaign_performance(self, customer_id: str, campaign_ids: Optional[List[str]], date_range: str) -> AsyncIterator[Dict]:
+        """Validate the report arguments and stream the raw campaign performance results"""
+        endpoint = f"customers/{customer_id}/googleAds:searchStream"
+        
+        if date_range not in DATE_RANGES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid date range: {date_range}. Valid date ranges are: {', '.join(sorted(DATE_RANGES))}"
+            )
+        
+        # Add campaign filter if specified
+        campaign_ids = tuple(campaign_ids or ())
+        for campaign_id in campaign_ids:
+            _validate_campaign_id(campaign_id)
+        
+        data = {"query": _campaign_performance_query(campaign_ids, date_range)}
+        
+        # searchStream returns a JSON array of result batches
+        return self._stream_request(endpoint, data, "item.results.item")
+    
+    async def get_campaign_performance_stream(self, customer_id: str, campaign_ids: List[str] = None, date_range: str = "LAST_30_DAYS") -> AsyncIterator[CampaignPerformanceRow]:
         """
+        Stream performance metrics for campaigns, one row at a time
         
-        result = await self._make_request(endpoint, method="POST", data={"query": query})
+        Rows are parsed incrementally from the response body, so large reports
+        are never held in memory in full. Rows are slotted dataclasses, which
+        orjson serializes directly for the NDJSON endpoint.
         
-        if "results" in result and len(result["results"]) > 0:
-            return result["results"][0].get("campaign", {})
-        else:
-            raise HTTPException(status_code=404, detail=f"Campaign {campaign_id} not found")
+        Args:
+            customer_id: The customer ID to get campaign performance for
+            campaign_ids: Optional list of campaign IDs to filter by
+            date_range: Time period for the report (e.g., LAST_7_DAYS, LAST_30_DAYS)
+            
+        Yields:
+            CampaignPerformanceRow: Campaign performance metrics
+        """
+        async for item in self._search_campaign_performance(customer_id, campaign_ids, date_range):
+            yield CampaignPerformanceRow(*_performance_values(item))
     
     async def get_campaign_performance(self, customer_id: str, campaign_ids: List[str] = None, date_range: str = "LAST_30_DAYS") -> List[Dict]:
         """
@@ -401,56 +900,45 @@ class GoogleAdsService:
         logger.info(f"Getting campaign performance for customer ID: {customer_id}")
         
         try:
-            endpoint = f"customers/{customer_id}/googleAds:search"
+            # Plain dicts, since FastAPI's response_model validation would convert dataclasses anyway
+            performance_data = [
+                dict(zip(CAMPAIGN_PERFORMANCE_FIELDS, _performance_values(item)))
+                async for item in self._search_campaign_performance(customer_id, campaign_ids, date_range)
+            ]
             
-            query = f"""
-                SELECT
-                    campaign.id,
-                    campaign.name,
-                    campaign.status,
-                    metrics.impressions,
-                    metrics.clicks,
-                    metrics.cost_micros,
-                    metrics.conversions,
-                    metrics.average_cpc
-                FROM campaign
-                WHERE segments.date DURING {date_range}
-            """
-            
-            # Add campaign filter if specified
-            if campaign_ids and len(campaign_ids) > 0:
-                campaign_ids_str = ", ".join(campaign_ids)
-                query += f" AND campaign.id IN ({campaign_ids_str})"
+            logger.info(f"Successfully retrieved performance data for {len(performance_data)} campaigns")
+            return performance_data
             
-            data = {"query": query}
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Error getting campaign performance: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Error getting campaign performance: {str(e)}")
+    
+    async def get_campaign_performance_columns(self, customer_id: str, campaign_ids: List[str] = None, date_range: str = "LAST_30_DAYS") -> Dict[str, List]:
+        """
+        Get performance metrics for campaigns in columnar form
+        
+        Args:
+            customer_id: The customer ID to get campaign performance for
+            campaign_ids: Optional list of campaign IDs to filter by
+            date_range: Time period for the report (e.g., LAST_7_DAYS, LAST_30_DAYS)
             
-            # Make the request
-            result = await self._make_request(endpoint, method="POST", data=data)
+        Returns:
+            Dict[str, List]: One list per metric field, all in the same row order
+        """
+        logger.info(f"Getting campaign performance columns for customer ID: {customer_id}")
+        
+        try:
+            columns = {name: [] for name in CAMPAIGN_PERFORMANCE_FIELDS}
+            column_lists = tuple(columns.values())
             
-            # Process the results
-            performance_data = []
-            if "results" in result:
-                for item in result["results"]:
-                    campaign = item.get("campaign", {})
-                    metrics = item.get("metrics", {})
-                    
-                    # Convert micros to regular currency units
-                    cost = float(metrics.get("costMicros", 0)) / 1_000_000 if "costMicros" in metrics else 0
-                    avg_cpc = float(metrics.get("averageCpc", 0)) / 1_000_000 if "averageCpc" in metrics else 0
-                    
-                    performance_data.append({
-                        "campaignId": campaign.get("id", ""),
-                        "campaignName": campaign.get("name", ""),
-                        "status": campaign.get("status", ""),
-                        "impressions": int(metrics.get("impressions", 0)),
-                        "clicks": int(metrics.get("clicks", 0)),
-                        "cost": cost,
-                        "conversions": float(metrics.get("conversions", 0)),
-                        "averageCpc": avg_cpc
-                    })
+            async for item in self._search_campaign_performance(customer_id, campaign_ids, date_range):
+                for column, value in zip(column_lists, _performance_values(item)):
+                    column.append(value)
             
-            logger.info(f"Successfully retrieved performance data for {len(performance_data)} campaigns")
-            return performance_data
+            logger.info(f"Successfully retrieved performance data for {len(columns['campaignId'])} campaigns")
+            return columns
             
         except HTTPException:
             raise
@@ -476,16 +964,13 @@ class GoogleAdsService:
         try:
             # Get campaign info to check current values and get resource names
             campaign_info = await self._get_campaign_info(customer_id, campaign_id)
-            logger.info(f"Campaign info: {campaign_info}")
+            logger.debug("Campaign info: %s", campaign_info)
             
             # Validate the bidding strategy
-            valid_strategies = ["MAXIMIZE_CONVERSIONS", "MAXIMIZE_CONVERSION_VALUE", "TARGET_CPA", 
-                             "TARGET_ROAS", "MANUAL_CPC", "TARGET_SPEND"]
-            
-            if bidding_strategy not in valid_strategies:
+            if bidding_strategy not in BIDDING_STRATEGIES:
                 raise HTTPException(
                     status_code=400, 
-                    detail=f"Invalid bidding strategy: {bidding_strategy}. Valid strategies are: {', '.join(valid_strategies)}"
+                    detail=f"Invalid bidding strategy: {bidding_strategy}. Valid strategies are: {', '.join(BIDDING_STRATEGIES)}"
                 )
             
             response = {
@@ -499,36 +984,13 @@ class GoogleAdsService:
                 }
             }
             
-            # Create mutation for updating bidding strategy
-            endpoint = f"customers/{customer_id}/campaigns:mutate"
-            
-            # Map API bidding strategy names to the required format for the API
-            strategy_mapping = {
-                "MAXIMIZE_CONVERSIONS": {"maximizeConversions": {}},
-                "MAXIMIZE_CONVERSION_VALUE": {"maximizeConversionValue": {}},
-                "TARGET_CPA": {"targetCpa": {"targetCpaMicros": "1000000"}},  # Default $1 CPA
-                "TARGET_ROAS": {"targetRoas": {"targetRoas": 1.0}},  # Default 100% ROAS
-                "MANUAL_CPC": {"manualCpc": {"enhancedCpcEnabled": True}},
-                "TARGET_SPEND": {"targetSpend": {}}
-            }
-            
             # Build the mutation data
-            data = {
-                "operations": [
-                    {
-                        "updateMask": "biddingStrategy",
-                        "update": {
-                            "resourceName": f"customers/{customer_id}/campaigns/{campaign_id}",
-                            "biddingStrategy": strategy_mapping[bidding_strategy]
-                        }
-                    }
-                ]
-            }
+            ops = [_bidding_strategy_operation(customer_id, campaign_id, bidding_strategy)]
             
             # Make the API call to update the bidding strategy
             try:
-                update_result = await self._make_request(endpoint, method="POST", data=data)
-                logger.info(f"Bidding strategy update result: {update_result}")
+                update_result = await self.mutate_campaigns(customer_id, ops)
+                logger.info("Bidding strategy update result: %s", update_result)
                 
                 response["update_details"]["updates"].append({
                     "type": "bidding_strategy",
@@ -556,4 +1018,206 @@ class GoogleAdsService:
         except Exception as e:
             error_msg = f"Error updating campaign bidding strategy: {str(e)}"
             logger.error(error_msg)
-            raise HTTPException(status_code=500, detail=error_msg) 
\ No newline at end of file
+            raise HTTPException(status_code=500, detail=error_msg)
+    
+    async def bulk_update(self, customer_id: str, updates: List[Dict]) -> Dict:
+        """
+        Update budgets and/or bidding strategies of several campaigns in one mutate call
+        
+        Args:
+            customer_id: The customer ID that owns the campaigns
+            updates: List of updates, each with campaignId and any of newBudget, newBid,
+                     biddingStrategy and budgetResource (skips the campaign lookup)
+            
+        Returns:
+            Dict: Update status
+        """
+        logger.info(f"Bulk updating {len(updates)} campaigns in account {customer_id}")
+        
+        try:
+            response = {
+                "success": True,
+                "message": "Bulk update initiated",
+                "update_details": {
+                    "customer_id": customer_id,
+                    "updates": []
+                }
+            }
+            
+            for update in updates:
+                _validate_campaign_update(update)
+            
+            # Look up missing budget resources concurrently
+            missing = [
+                update.get("campaignId") for update in updates
+                if update.get("newBudget") and not update.get("budgetResource")
+            ]
+            campaign_infos = await _gather_bounded(
+                self._get_campaign_info(customer_id, campaign_id) for campaign_id in missing
+            )
+            budget_resources = {
+                campaign_id: campaign_info.get("campaignBudget", "")
+                for campaign_id, campaign_info in zip(missing, campaign_infos)
+            }
+            
+            ops = []
+            op_updates = []  # Response entries backed by an operation in ops
+            
+            for update in updates:
+                campaign_id = update.get("campaignId")
+                new_budget = update.get("newBudget")
+                new_bid = update.get("newBid")
+                bidding_strategy = update.get("biddingStrategy")
+                
+                if new_budget:
+                    budget_resource = update.get("budgetResource") or budget_resources.get(campaign_id, "")
+                    if not budget_resource:
+                        raise HTTPException(status_code=400, detail=f"Campaign {campaign_id}: budget resource not found")
+                    
+                    # Convert currency to micros (Google Ads API uses micros)
+                    budget_micros = int(new_budget * MICROS_PER_UNIT)
+                    ops.append(_budget_operation(budget_resource, budget_micros))
+                    op_updates.append({
+                        "campaign_id": campaign_id,
+                        "type": "budget",
+                        "new_value": new_budget,
+                        "new_value_micros": budget_micros
+                    })
+                
+                if bidding_strategy:
+                    ops.append(_bidding_strategy_operation(customer_id, campaign_id, bidding_strategy))
+                    op_updates.append({
+                        "campaign_id": campaign_id,
+                        "type": "bidding_strategy",
+                        "new_value": bidding_strategy
+                    })
+                
+                if new_bid:
+                    response["update_details"]["updates"].append({
+                        "campaign_id": campaign_id,
+                        "type": "bid",
+                        "new_value": new_bid,
+                        "status": "not_implemented"
+                    })
+            
+            if ops:
+                # All operations go out in a single request; the API applies them atomically
+                try:
+                    update_result = await self.mutate_campaigns(customer_id, ops)
+                    logger.info("Bulk update result: %s", update_result)
+                    for entry in op_updates:
+                        entry["status"] = "success"
+                except Exception as e:
+                    logger.error(f"Error in bulk update: {str(e)}")
+                    response["success"] = False
+                    response["message"] = f"Error in bulk update: {str(e)}"
+                    for entry in op_updates:
+                        entry["status"] = "failed"
+                        entry["error"] = str(e)
+                response["update_details"]["updates"][:0] = op_updates
+            
+            return response
+            
+        except HTTPException as e:
+            logger.error(f"Error in bulk_update: {e.detail}")
+            raise
+        except Exception as e:
+            error_msg = f"Error in bulk update: {str(e)}"
+            logger.error(error_msg)
+            raise HTTPException(status_code=500, detail=error_msg)
+    
+    async def update_campaigns_bulk(self, customer_id: str, updates: List[Dict]) -> Dict:
+        """
+        Update several campaigns concurrently, each with its own mutate calls
+        
+        Unlike bulk_update, updates are independent: a failing campaign is reported
+        in the response without aborting the others.
+        
+        Args:
+            customer_id: The customer ID that owns the campaigns
+            updates: List of updates, each with campaignId and any of newBudget, newBid,
+                     biddingStrategy and budgetResource (skips the campaign lookup)
+            
+        Returns:
+            Dict: Update status
+        """
+        logger.info(f"Updating {len(updates)} campaigns concurrently in account {customer_id}")
+        
+        for update in updates:
+            _validate_campaign_update(update)
+        
+        async def apply(update: Dict) -> List[Dict]:
+            campaign_id = update.get("campaignId")
+            update_types = []
+            tasks = []
+            if update.get("newBudget") or update.get("newBid"):
+                update_types.append("budget" if update.get("newBudget") else "bid")
+                tasks.append(self.update_bid_and_budget(
+                    customer_id,
+                    campaign_id,
+                    update.get("newBudget"),
+                    update.get("newBid"),
+                    update.get("budgetResource")
+                ))
+            if update.get("biddingStrategy"):
+                update_types.append("bidding_strategy")
+                tasks.append(self.update_bidding_strategy(
+                    customer_id,
+                    campaign_id,
+                    update.get("biddingStrategy")
+                ))
+            
+            # Each sub-update is reported on its own, so a failing budget update
+            # does not hide a bidding strategy change that was applied
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            
+            entries = []
+            for update_type, result in zip(update_types, results):
+                if isinstance(result, Exception):
+                    error = result.detail if isinstance(result, HTTPException) else str(result)
+                    logger.error(f"Error updating {update_type} of campaign {campaign_id}: {error}")
+                    entries.append({
+                        "campaign_id": campaign_id,
+                        "type": update_type,
+                        "status": "failed",
+                        "error": error
+                    })
+                else:
+                    entries.extend(
+                        {"campaign_id": campaign_id, **entry}
+                        for entry in result["update_details"]["updates"]
+                    )
+            return entries
+        
+        results = await _gather_bounded((apply(update) for update in updates), return_exceptions=True)
+        
+        response = {
+            "success": True,
+            "message": "Bulk update initiated",
+            "update_details": {
+                "customer_id": customer_id,
+                "updates": []
+            }
+        }
+        
+        failures = 0
+        for update, result in zip(updates, results):
+            if isinstance(result, Exception):
+                error = result.detail if isinstance(result, HTTPException) else str(result)
+                logger.error(f"Error updating campaign {update.get('campaignId')}: {error}")
+                failures += 1
+                response["update_details"]["updates"].append({
+                    "campaign_id": update.get("campaignId"),
+                    "status": "failed",
+                    "error": error
+                })
+                continue
+            if any(entry["status"] == "failed" for entry in result):
+                failures += 1
+            response["update_details"]["updates"].extend(result)
+        
+        if failures:
+            response["success"] = False
+            response["message"] = f"{failures} of {len(updates)} campaign updates failed"
+        
+        return response
\ No newline at end of file
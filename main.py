@@ -1,5 +1,6 @@
 import os
 import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
@@ -15,11 +16,20 @@ logger = logging.getLogger("google-ads-mcp-api")
 # Load environment variables
 load_dotenv()
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan: release the shared Google Ads HTTP session on shutdown
+    """
+    yield
+    await google_ads_router.close_ads_service()
+
 # Create FastAPI app
 app = FastAPI(
     title="Google Ads MCP API",
     description="API for Google Ads Management Control Panel",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware